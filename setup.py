@@ -13,6 +13,7 @@ setup(
     packages=find_packages(),
     install_requires=[
         # Add your dependencies here
+        'orjson>=3.8',
     ],
     entry_points={
         'console_scripts': [
@@ -14,6 +14,7 @@ from unsigned_generator.constants import (
     VERIFIABLE_CREDENTIAL_V2_CONTEXT
 )
 from unsigned_generator.schema import Issuer, Subject
+from unsigned_generator.utils import Utils
 
 
 class UnsignedCertGenerator:
@@ -118,14 +119,11 @@ class UnsignedCertGenerator:
 
         # Create json content of additional fields
         global_fields = json.loads(unsigned_cert_data["additional_global_fields"])["fields"]
-        recipient_fields = json.loads(
-            unsigned_cert_data["additional_per_recipient_fields"]
-        )["fields"]
 
         # Insert additional fields in template json
         if global_fields:
             field = global_fields[1]
-            assertion = set_field(assertion, field["path"], field["value"])
+            assertion = Utils.set_field(assertion, field["path"], field["value"])
 
         return assertion
 
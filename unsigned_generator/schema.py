@@ -2,10 +2,12 @@
 Schema definitions for the unsigned-gen package.
 
 This module defines the data classes for representing the issuer and subject information
-required for generating unsigned certificates.
+required for generating unsigned certificates, and the unsigned certificate data itself.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional
 
 
 @dataclass
@@ -22,6 +24,16 @@ class Issuer:
         revocation_list (str): The revocation list URL of the issuer.
         crypto_address (str): The cryptocurrency address of the issuer.
     """
+    __slots__ = (
+        "name",
+        "email",
+        "website",
+        "did",
+        "profile_link",
+        "revocation_list",
+        "crypto_address",
+    )
+
     name: str
     email: str
     website: str
@@ -41,6 +53,116 @@ class Subject:
         did (str): The decentralized identifier (DID) of the subject.
         profile_link (str): The profile link of the subject.
     """
+    __slots__ = ("title", "did", "profile_link")
+
     title: str
     did: str
     profile_link: str
+
+
+@dataclass(eq=False)
+class CertData(Mapping):
+    """
+    Data class to represent the unsigned certificate data.
+
+    The attribute names are the keys of the former dictionary form of the data. CertData
+    is a read-only Mapping over them (``cert_data["issuer_name"]``, ``keys``, ``get``,
+    ``dict(cert_data)``); values are updated through their attributes
+    (``cert_data.roster = ...``). Use ``to_dict`` to get a plain, mutable dictionary,
+    e.g. for ``json.dumps`` or to add keys.
+
+    Attributes:
+        validFrom (str, optional): Start date of the certificate's validity.
+        validUntil (str, optional): End date of the certificate's validity.
+        issuer_url (str): The website of the issuer.
+        issuer_email (str): The email address of the issuer.
+        issuer_name (str): The name of the issuer.
+        issuer_did (str): The decentralized identifier (DID) of the issuer.
+        issuer_id (str): The profile link of the issuer.
+        revocation_list (str): The revocation list URL of the issuer.
+        issuer_public_key (str): The public key of the issuer.
+        subject_did (str): The decentralized identifier (DID) of the subject.
+        subject_profile (str): The profile link of the subject.
+        certificate_title (str): The title of the certificate.
+        roster (object): The certificate records.
+        issuer_logo_file (str): Path to the issuer's logo image file.
+        cert_image_file (str): Path to the certificate image file.
+        additional_global_fields (dict): Additional global fields for the certificate.
+        additional_per_recipient_fields (dict): Additional per-recipient fields.
+        certificate_description (str): The description of the certificate.
+        criteria_narrative (str): The narrative of the certificate criteria.
+        filename_format (str): The file name format of the generated certificates.
+        no_clobber (bool): Whether existing certificates must be kept.
+        hash_emails (bool): Whether recipient emails must be hashed.
+    """
+    __slots__ = (
+        "validFrom",
+        "validUntil",
+        "issuer_url",
+        "issuer_email",
+        "issuer_name",
+        "issuer_did",
+        "issuer_id",
+        "revocation_list",
+        "issuer_public_key",
+        "subject_did",
+        "subject_profile",
+        "certificate_title",
+        "roster",
+        "issuer_logo_file",
+        "cert_image_file",
+        "additional_global_fields",
+        "additional_per_recipient_fields",
+        "certificate_description",
+        "criteria_narrative",
+        "filename_format",
+        "no_clobber",
+        "hash_emails",
+    )
+    _KEYS = frozenset(__slots__)
+
+    validFrom: Optional[str]
+    validUntil: Optional[str]
+    issuer_url: str
+    issuer_email: str
+    issuer_name: str
+    issuer_did: str
+    issuer_id: str
+    revocation_list: str
+    issuer_public_key: str
+    subject_did: str
+    subject_profile: str
+    certificate_title: str
+    roster: Any
+    issuer_logo_file: str
+    cert_image_file: str
+    additional_global_fields: Any
+    additional_per_recipient_fields: Any
+    certificate_description: str
+    criteria_narrative: str
+    filename_format: str
+    no_clobber: bool
+    hash_emails: bool
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._KEYS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the dictionary form of the unsigned certificate data.
+
+        Returns:
+            dict: The unsigned certificate data keyed by attribute name.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
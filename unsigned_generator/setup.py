@@ -6,6 +6,7 @@ setup(
     packages=find_packages(),
     install_requires=[
         "jsonpath-rw==1.4.0",
+        "orjson>=3.8",
     ],
     include_package_data=True,
     description="A package to generate unsigned certificate data.",
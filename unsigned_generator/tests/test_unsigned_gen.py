@@ -5,52 +5,20 @@ This module contains tests for the UnsignedCertGenerator class,
 which is responsible for generating unsigned certificate data.
 """
 
-import importlib.util
+import json
 import os
 import sys
 import unittest
 
-# Add the unsigned_generator directory to the sys.path
-base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-unsigned_generator_dir = os.path.join(base_dir, 'unsigned_generator')
-sys.path.insert(0, unsigned_generator_dir)
+# Add the repository root to the sys.path so the package imports when run directly
+base_dir = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+sys.path.insert(0, base_dir)
 
-# Function to import a module from a file path
-def import_module_from_path(module_name, file_path):
-    """
-    Import a module from a specific file path.
-
-    Args:
-        module_name (str): The name to assign to the imported module.
-        file_path (str): The file path to the module.
-
-    Returns:
-        module: The imported module.
-    """
-    print(f"Importing {module_name} from {file_path}")
-    spec = importlib.util.spec_from_file_location(module_name, file_path)
-    if spec is None:
-        raise ImportError(f"Cannot find module {module_name} at {file_path}")
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
-    spec.loader.exec_module(module)
-    return module
-
-# Define the paths to the modules
-schema_path = os.path.join(unsigned_generator_dir, 'schema.py')
-unsigned_gen_path = os.path.join(unsigned_generator_dir, 'unsigned_gen.py')
-
-# Verify the paths
-print(f"Schema path: {schema_path}")
-print(f"Unsigned gen path: {unsigned_gen_path}")
-
-# Import the modules
-schema = import_module_from_path('schema', schema_path)
-unsigned_gen = import_module_from_path('unsigned_gen', unsigned_gen_path)
-
-Issuer = schema.Issuer
-Subject = schema.Subject
-UnsignedCertGenerator = unsigned_gen.UnsignedCertGenerator
+from unsigned_generator.schema import Issuer, Subject
+from unsigned_generator.unsigned_gen import UnsignedCertGenerator
+from unsigned_generator.utils import Recipient
 
 class TestUnsignedCertGenerator(unittest.TestCase):
     """
@@ -83,6 +51,50 @@ class TestUnsignedCertGenerator(unittest.TestCase):
         self.app_name = "TestApp"
         self.recipient_fields = {"recipient1": "value1"}
 
+    def _generate(self, **overrides):
+        """
+        Generate unsigned certificate data from the test case defaults.
+
+        Args:
+            **overrides: generate_unsigned_cert_data arguments replacing the defaults.
+
+        Returns:
+            CertData: The generated unsigned certificate data.
+        """
+        arguments = {
+            "issuer": self.issuer,
+            "subject": self.subject,
+            "records_json": self.records_json,
+            "issuer_image": self.issuer_image,
+            "subject_image": self.subject_image,
+            "additional_global_fields": self.additional_global_fields,
+            "app_name": self.app_name,
+            "recipient_fields": self.recipient_fields,
+        }
+        arguments.update(overrides)
+        return self.generator.generate_unsigned_cert_data(**arguments)
+
+    def _generate_many(self, records):
+        """
+        Generate unsigned certificate data for several rosters from the test case defaults.
+
+        Args:
+            records (list): Certificate records, one roster per generated entry.
+
+        Returns:
+            list: The generated unsigned certificate data.
+        """
+        return self.generator.generate_many(
+            self.issuer,
+            self.subject,
+            records,
+            self.issuer_image,
+            self.subject_image,
+            self.additional_global_fields,
+            self.app_name,
+            self.recipient_fields
+        )
+
     def test_generate_certificate(self):
         """
         Test the generate_unsigned_cert_data method of UnsignedCertGenerator.
@@ -102,5 +114,208 @@ class TestUnsignedCertGenerator(unittest.TestCase):
         self.assertIn("subject_did", cert)
         self.assertEqual(cert["subject_did"], self.subject.did)
 
+    def test_additional_fields_stored_as_objects(self):
+        """
+        Test that the additional fields are kept as the given objects, not as JSON strings.
+        """
+        cert = self._generate()
+        self.assertIs(cert["additional_global_fields"], self.additional_global_fields)
+        self.assertIs(cert["additional_per_recipient_fields"], self.recipient_fields)
+
+    def test_create_certificate_template_from_serialized_fields(self):
+        """
+        Test that additional fields given in their legacy JSON string form still apply.
+        """
+        global_fields = {
+            "fields": [
+                {"path": "$.credentialSubject.id", "value": "unused"},
+                {"path": "$.credentialSubject.name", "value": "Name"},
+            ]
+        }
+        cert = self._generate(additional_global_fields=global_fields)
+        template = self.generator.create_certificate_template(cert)
+        self.assertEqual(template["credentialSubject"]["name"], "Name")
+
+        cert_dict = cert.to_dict()
+        cert_dict["additional_global_fields"] = json.dumps(global_fields)
+        self.assertEqual(
+            self.generator.create_certificate_template(cert_dict), template
+        )
+
+    def _assert_templates_are_independent(self, additional_global_fields):
+        """
+        Assert that templates built from the same unsigned data do not share values.
+
+        Args:
+            additional_global_fields (object): Global fields with a nested value at
+            $.credentialSubject.tags.
+        """
+        cert = self._generate(additional_global_fields=additional_global_fields)
+        first = self.generator.create_certificate_template(cert)
+        first["credentialSubject"]["tags"]["k"].append(99)
+        second = self.generator.create_certificate_template(cert)
+        self.assertEqual(second["credentialSubject"]["tags"], {"k": [1]})
+
+    def test_templates_are_independent(self):
+        """
+        Test that templates neither share values with each other nor with the input fields.
+        """
+        global_fields = {
+            "fields": [
+                {"path": "$.credentialSubject.id", "value": "unused"},
+                {"path": "$.credentialSubject.tags", "value": {"k": [1]}},
+            ]
+        }
+        self._assert_templates_are_independent(json.dumps(global_fields))
+        self._assert_templates_are_independent(global_fields)
+        self.assertEqual(global_fields["fields"][1]["value"], {"k": [1]})
+
+    def test_roster_certificates_are_independent(self):
+        """
+        Test that changing one roster certificate leaves its siblings and inputs untouched.
+        """
+        global_fields = {
+            "fields": [
+                {"path": "$.credentialSubject.id", "value": "unused"},
+                {"path": "$.credentialSubject.achievement", "value": {"name": "N"}},
+            ]
+        }
+        template = self.generator.create_certificate_template(
+            self._generate(additional_global_fields=global_fields)
+        )
+        recipients = [
+            Recipient(
+                {"name": name, "email": email, "slug": {"pubkey": "", "html": ""}}
+            )
+            for name, email in (("A", "a@example.com"), ("B", "b@example.com"))
+        ]
+        holder_data = {
+            "a@example.com": "did:example:a",
+            "did:example:a": "https://a.example.com",
+            "b@example.com": "did:example:b",
+            "did:example:b": "https://b.example.com",
+        }
+        certs, _ = self.generator.create_unsigned_certificates_from_roster(
+            template, recipients, False, ["name"], holder_data
+        )
+        first, second = certs.values()
+        first["credentialSubject"]["achievement"]["name"] = "changed"
+        first["issuer"]["id"] = "changed"
+        first["@context"].append("changed")
+
+        self.assertEqual(second["credentialSubject"]["achievement"], {"name": "N"})
+        self.assertEqual(second["issuer"]["id"], self.issuer.did)
+        self.assertNotIn("changed", second["@context"])
+        self.assertEqual(global_fields["fields"][1]["value"], {"name": "N"})
+
+    def test_cert_data_dictionary_form(self):
+        """
+        Test that CertData keeps the item access and keys of its dictionary form.
+        """
+        cert = self._generate()
+        cert_dict = cert.to_dict()
+        self.assertEqual(cert_dict["issuer_public_key"], "ecdsa-koblitz-pubkey:123abc")
+        self.assertEqual(cert_dict["roster"], cert["roster"])
+        self.assertNotIn("to_dict", cert)
+        with self.assertRaises(KeyError):
+            cert["to_dict"]  # pylint: disable=pointless-statement
+        self.assertEqual(dict(cert), cert_dict)
+        self.assertEqual(cert, cert_dict)
+        with self.assertRaises(TypeError):
+            cert["roster"] = "changed"
+        self.assertEqual(list(cert), list(cert_dict))
+        self.assertEqual(cert.get("issuer_name"), self.issuer.name)
+        self.assertIsNone(cert.get("to_dict"))
+
+    def test_create_certificate_template_from_partial_dictionary(self):
+        """
+        Test that a dictionary with only the keys the template needs is still accepted.
+        """
+        template = self.generator.create_certificate_template(
+            {
+                "issuer_did": self.issuer.did,
+                "issuer_id": self.issuer.profile_link,
+                "validFrom": None,
+                "validUntil": None,
+                "subject_did": self.subject.did,
+                "subject_profile": self.subject.profile_link,
+                "additional_global_fields": {"fields": []},
+                "unrelated": "ignored",
+            }
+        )
+        self.assertEqual(template["credentialSubject"]["id"], self.subject.did)
+
+    def test_create_certificate_template_from_dictionary(self):
+        """
+        Test that the certificate template is the same for CertData and its dictionary form.
+        """
+        cert = self._generate(
+            additional_global_fields={
+                "fields": [{"path": "$.credentialSubject.name", "value": "Name"}]
+            }
+        )
+        template = self.generator.create_certificate_template(cert)
+        self.assertEqual(template["issuer"]["id"], self.issuer.did)
+        self.assertNotIn("name", template["credentialSubject"])
+        self.assertEqual(
+            self.generator.create_certificate_template(cert.to_dict()), template
+        )
+
+    def test_generate_many(self):
+        """
+        Test that generate_many matches generate_unsigned_cert_data for each roster.
+        """
+        rosters = ['{"records": [1]}', '{"records": [2]}', '{"records": [3]}']
+        certs = self._generate_many(rosters)
+        self.assertEqual([cert["roster"] for cert in certs], rosters)
+        for records_json, cert in zip(rosters, certs):
+            self.assertEqual(cert, self._generate(records_json=records_json))
+
+    def test_generate_many_shares_additional_fields(self):
+        """
+        Test that generate_many shares the nested additional fields between its results.
+        """
+        certs = self._generate_many(["first", "second"])
+        self.assertIs(
+            certs[0]["additional_global_fields"], certs[1]["additional_global_fields"]
+        )
+        self.assertIs(
+            certs[0]["additional_per_recipient_fields"],
+            certs[1]["additional_per_recipient_fields"],
+        )
+        certs[0].roster = "changed"
+        self.assertEqual(certs[1]["roster"], "second")
+
+    def test_generate_unsigned_certificates_w3c(self):
+        """
+        Test that generate_unsigned_certificates_w3c returns parseable JSON credentials.
+        """
+        cert = self._generate(
+            records_json=[
+                {
+                    "name": "Zoë",
+                    "email": "zoe@example.com",
+                    "slug": {"pubkey": "key", "html": "<p></p>", "course": "Café"},
+                }
+            ],
+            additional_global_fields={"fields": []},
+            recipient_fields={"fields": [{"path": "$.credentialSubject.course"}]},
+        )
+        holder_data = {
+            "zoe@example.com": "did:example:789",
+            "did:example:789": "https://holder.example.com/profile",
+        }
+        certs_info, credentials_json = self.generator.generate_unsigned_certificates_w3c(
+            cert, holder_data
+        )
+        self.assertEqual(len(credentials_json), 1)
+        self.assertIn("Café", credentials_json[0])
+        credential = json.loads(credentials_json[0])
+        self.assertEqual(credential["holder"]["id"], "did:example:789")
+        self.assertEqual(
+            credential["credentialSubject"]["subjectMetaData"], {"course": "Café"}
+        )
+        self.assertIn(credential["id"].split(":")[-1], certs_info)
+
 if __name__ == '__main__':
     unittest.main()
@@ -6,33 +6,64 @@ the data required for creating unsigned certificates.
 """
 
 import copy
-import json
+import dataclasses
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+import orjson
 
 from unsigned_generator.constants import (
     EVERYCRED_CREDENTIAL_V1_CONTEXT,
     URN_UUID_PREFIX,
     VERIFIABLE_CREDENTIAL_V2_CONTEXT,
 )
-from unsigned_generator.schema import Issuer, Subject
+from unsigned_generator.schema import CertData, Issuer, Subject
 
 from .utils import Utils, Recipient
 
+# Static parts of the assertion skeleton, shared by every certificate template
+_ASSERTION_CONTEXT = (
+    VERIFIABLE_CREDENTIAL_V2_CONTEXT,
+    EVERYCRED_CREDENTIAL_V1_CONTEXT,
+)
+_ASSERTION_TYPES = ("VerifiableCredential", "EveryCREDCredential")
+
+# Options used when serializing the generated credentials
+_CREDENTIAL_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+_CRITERIA_NARRATIVE = (
+    "This is a blockchain-based certificate which is issued by a blockchain transaction."
+)
+
+
+def _load_fields(document: Any) -> list:
+    """Return the ``fields`` list of an additional fields document.
+
+    The document is used as is when it is already parsed, and is only decoded when
+    it is given in its serialized JSON form (e.g. unsigned data loaded from storage).
+    """
+    if isinstance(document, (str, bytes)):
+        document = orjson.loads(document)
+    return document["fields"]
+
 
 class UnsignedCertGenerator:
     """
     Class to generate unsigned certificate data.
 
     Methods:
-        generate_unsigned_cert_data: Generate the dictionary of data required for
-        generating unsigned certificates.
+        generate_unsigned_cert_data: Generate the data required for generating
+        unsigned certificates.
+        generate_many: Generate unsigned certificate data for several rosters at once.
         _create_base_template: Create the base template for unsigned certificate data.
     """
 
+    # The generator holds no per-instance state
+    __slots__ = ()
+
+    @staticmethod
     def generate_unsigned_cert_data(
-        self,
         issuer: Issuer,
         subject: Subject,
         records_json: str,
@@ -43,14 +74,17 @@ class UnsignedCertGenerator:
         recipient_fields: Dict[str, Any],
         valid_from: Optional[str] = None,
         valid_until: Optional[str] = None,
-    ) -> Dict[str, Any]:
+    ) -> CertData:
         """
-        Generate the dictionary of data required for generating unsigned certificates.
+        Generate the data required for generating unsigned certificates.
 
-        This function constructs a dictionary containing various parameters needed for generating
+        This function constructs a CertData containing various parameters needed for generating
         unsigned certificates. It takes issuer and subject information, certificate data, and
         additional fields as input and creates the required data structure.
 
+        The additional global and per-recipient fields are stored as given, not copied, so
+        later changes to these objects are visible in the returned data.
+
         Args:
             issuer (Issuer): An object representing the issuer of the certificate.
             subject (Subject): An object representing the subject of the certificate.
@@ -64,11 +98,10 @@ class UnsignedCertGenerator:
             valid_until (str, optional): End date of the certificate's validity.
 
         Returns:
-            dict: A dictionary containing all the necessary data
-            for generating unsigned certificates.
+            CertData: All the necessary data for generating unsigned certificates.
         """
-        # Construct the unsigned_cert_data dictionary
-        unsigned_cert_data = self._create_base_template(
+        # Construct the unsigned_cert_data
+        unsigned_cert_data = UnsignedCertGenerator._create_base_template(
             issuer,
             subject,
             records_json,
@@ -82,17 +115,70 @@ class UnsignedCertGenerator:
         )
         return unsigned_cert_data
 
-    def create_certificate_template(self, unsigned_cert_data: object):
+    @staticmethod
+    def generate_many(
+        issuer: Issuer,
+        subject: Subject,
+        records: List[Any],
+        issuer_image: str,
+        subject_image: str,
+        additional_global_fields: Dict[str, Any],
+        app_name: str,
+        recipient_fields: Dict[str, Any],
+        valid_from: Optional[str] = None,
+        valid_until: Optional[str] = None,
+    ) -> List[CertData]:
+        """
+        Generate unsigned certificate data for several rosters sharing the same settings.
+
+        The issuer, subject and additional fields derived data is built once and each
+        roster only gets a shallow copy of it, so nested values such as the additional
+        fields are shared between the returned CertData.
+
+        Args:
+            issuer (Issuer): An object representing the issuer of the certificates.
+            subject (Subject): An object representing the subject of the certificates.
+            records (list): Certificate records, one roster per generated entry.
+            issuer_image (str): Path to the issuer's logo image file.
+            subject_image (str): Path to the certificate image file.
+            additional_global_fields (dict): Additional global fields for the certificates.
+            app_name (str): Name of the application generating the certificates.
+            recipient_fields (dict): Additional per-recipient fields for the certificates.
+            valid_from (str, optional): Start date of the certificates' validity.
+            valid_until (str, optional): End date of the certificates' validity.
+
+        Returns:
+            list: The unsigned certificate data of each roster, in the order of records.
+        """
+        template = UnsignedCertGenerator._create_base_template(
+            issuer,
+            subject,
+            None,
+            issuer_image,
+            subject_image,
+            additional_global_fields,
+            app_name,
+            recipient_fields,
+            valid_from,
+            valid_until,
+        )
+
+        return [
+            dataclasses.replace(template, roster=records_json) for records_json in records
+        ]
+
+    @staticmethod
+    def create_certificate_template(unsigned_cert_data: object):
         """
         Create the certificate template using the provided unsigned certificate data.
 
         Args:
-            unsigned_cert_data (object): The unsigned certificate data.
+            unsigned_cert_data (CertData or dict): The unsigned certificate data.
 
         Returns:
             dict: The certificate template.
         """
-        return self._create_assertion(unsigned_cert_data)
+        return UnsignedCertGenerator._create_assertion(unsigned_cert_data)
 
     @staticmethod
     def create_unsigned_certificates_from_roster(
@@ -181,7 +267,7 @@ class UnsignedCertGenerator:
         certificate in batch.
 
         Args:
-            unsigned_cert_data (dict): Required information
+            unsigned_cert_data (CertData or dict): Required information
             to generate unsigned certificates.
             holder_data (dict): Dictionary containing holder information.
                 Format:
@@ -194,7 +280,10 @@ class UnsignedCertGenerator:
                 }
 
         Returns:
-            Generate unsigned certificates.
+            Generate unsigned certificates. The credentials are serialized with orjson:
+            compact separators, non-ASCII text as raw UTF-8 (not ``\\uXXXX`` escapes),
+            NaN and Infinity as ``null``, and integers outside the 64-bit range raise
+            ``orjson.JSONEncodeError``.
         """
 
         # Create list of recipients details.
@@ -205,7 +294,7 @@ class UnsignedCertGenerator:
             raise RuntimeError("Error processing recipients") from exp
 
         # Create certificate template
-        template = UnsignedCertGenerator().create_certificate_template(
+        template = UnsignedCertGenerator.create_certificate_template(
             unsigned_cert_data
         )
 
@@ -213,12 +302,12 @@ class UnsignedCertGenerator:
         use_identities = unsigned_cert_data["filename_format"] == "certname_identity"
 
         # Load additional recipient fields json content
-        recipient_fields = json.loads(
+        recipient_fields = _load_fields(
             unsigned_cert_data["additional_per_recipient_fields"]
-        )["fields"]
+        )
 
         # Generate unsigned certificate json content
-        certs, certs_info = UnsignedCertGenerator().create_unsigned_certificates_from_roster(
+        certs, certs_info = UnsignedCertGenerator.create_unsigned_certificates_from_roster(
             template,
             recipients,
             use_identities,
@@ -227,26 +316,28 @@ class UnsignedCertGenerator:
         )
 
         # Store each certificates of batch in output_dir.
-        credentials_json = [json.dumps(certs[uid]) for uid in certs.keys()]
+        credentials_json = [
+            orjson.dumps(certs[uid], option=_CREDENTIAL_DUMPS_OPTIONS).decode("utf-8")
+            for uid in certs.keys()
+        ]
 
         return certs_info, credentials_json
 
-    def _create_assertion(self, unsigned_cert_data: dict) -> dict:
+    @staticmethod
+    def _create_assertion(unsigned_cert_data: Any) -> dict:
         """
         Create the assertion section of credentials.
 
         Args:
-            unsigned_cert_data (dict): The unsigned certificate data.
+            unsigned_cert_data (CertData or dict): The unsigned certificate data.
 
         Returns:
             dict: The assertion section of the credentials.
         """
+        # Lists are built from the shared tuples as additional fields may update them
         assertion = {
-            "@context": [
-                VERIFIABLE_CREDENTIAL_V2_CONTEXT,
-                EVERYCRED_CREDENTIAL_V1_CONTEXT,
-            ],
-            "type": ["VerifiableCredential", "EveryCREDCredential"],
+            "@context": list(_ASSERTION_CONTEXT),
+            "type": list(_ASSERTION_TYPES),
             "issuer": {
                 "id": unsigned_cert_data["issuer_did"],
                 "profile": unsigned_cert_data["issuer_id"],
@@ -267,18 +358,20 @@ class UnsignedCertGenerator:
             "profile": unsigned_cert_data["subject_profile"],
         }
 
-        global_fields = json.loads(unsigned_cert_data["additional_global_fields"])[
-            "fields"
-        ]
+        global_fields = _load_fields(unsigned_cert_data["additional_global_fields"])
 
-        if global_fields:
+        # Only the second global field is applied to the assertion. Its value is copied
+        # so templates never share objects with the caller's additional fields.
+        if len(global_fields) > 1:
             field = global_fields[1]
-            assertion = Utils().set_field(assertion, field["path"], field["value"])
+            assertion = Utils().set_field(
+                assertion, field["path"], copy.deepcopy(field["value"])
+            )
 
         return assertion
 
+    @staticmethod
     def _create_base_template(
-        self,
         issuer: Issuer,
         subject: Subject,
         records_json: str,
@@ -289,12 +382,13 @@ class UnsignedCertGenerator:
         recipient_fields: Dict[str, Any],
         valid_from: Optional[str] = None,
         valid_until: Optional[str] = None,
-    ) -> Dict[str, Any]:
+    ) -> CertData:
         """
         Create the base template for unsigned certificate data.
 
-        This function constructs the base template dictionary containing various parameters needed
+        This function constructs the base template containing various parameters needed
         for generating unsigned certificates.
+        The additional fields objects are stored by reference.
 
         Args:
             issuer (Issuer): An object representing the issuer of the certificate.
@@ -309,36 +403,36 @@ class UnsignedCertGenerator:
             valid_until (str, optional): End date of the certificate's validity.
 
         Returns:
-            dict: A dictionary containing the base template for unsigned certificates.
+            CertData: The base template for unsigned certificates.
         """
-        return {
+        return CertData(
             # Credentials validity information
-            "validFrom": valid_from,
-            "validUntil": valid_until,
+            validFrom=valid_from,
+            validUntil=valid_until,
             # Issuer information
-            "issuer_url": issuer.website,
-            "issuer_email": issuer.email,
-            "issuer_name": issuer.name,
-            "issuer_did": issuer.did,
-            "issuer_id": issuer.profile_link,
-            "revocation_list": issuer.revocation_list,
-            "issuer_public_key": f"ecdsa-koblitz-pubkey:{issuer.crypto_address}",
+            issuer_url=issuer.website,
+            issuer_email=issuer.email,
+            issuer_name=issuer.name,
+            issuer_did=issuer.did,
+            issuer_id=issuer.profile_link,
+            revocation_list=issuer.revocation_list,
+            issuer_public_key=f"ecdsa-koblitz-pubkey:{issuer.crypto_address}",
             # Subject information
-            "subject_did": subject.did,
-            "subject_profile": subject.profile_link,
+            subject_did=subject.did,
+            subject_profile=subject.profile_link,
             # Certificate information
-            "certificate_title": subject.title,
-            "roster": records_json,
+            certificate_title=subject.title,
+            roster=records_json,
             # Certificate images
-            "issuer_logo_file": issuer_image,
-            "cert_image_file": subject_image,
+            issuer_logo_file=issuer_image,
+            cert_image_file=subject_image,
             # Additional fields
-            "additional_global_fields": json.dumps(additional_global_fields),
-            "additional_per_recipient_fields": json.dumps(recipient_fields),
+            additional_global_fields=additional_global_fields,
+            additional_per_recipient_fields=recipient_fields,
             # Static information
-            "certificate_description": f"Certificates are generated by {app_name}.",
-            "criteria_narrative": "This is a blockchain-based certificate which is issued by a blockchain transaction.",
-            "filename_format": "uuid",
-            "no_clobber": True,
-            "hash_emails": False,
-        }
+            certificate_description=f"Certificates are generated by {app_name}.",
+            criteria_narrative=_CRITERIA_NARRATIVE,
+            filename_format="uuid",
+            no_clobber=True,
+            hash_emails=False,
+        )
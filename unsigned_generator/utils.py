@@ -1,10 +1,29 @@
 """
 Utility functions for the unsigned_generator package.
 """
+import functools
 from typing import Any
 from jsonpath_rw import Child, Fields, Root, parse
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_path(path: str):
+    """Parse a JSONPath expression once and reuse it.
+
+    jsonpath_rw builds a new parser on every ``parse`` call, which costs far more
+    than evaluating the resulting expression.
+    """
+    return parse(path)
+
+
+@functools.lru_cache(maxsize=256)
+def _path_fields(path: str) -> tuple:
+    """Return the field names of a plain JSONPath expression, outermost first."""
+    fields = []
+    Utils.recurse(_compile_path(path), fields)
+    return tuple(fields)
+
+
 class Recipient:
     """Recipient information from roster file.
 
@@ -114,15 +133,14 @@ class Utils:
         Return:
             Create row josn for each field
         """
-        jp = parse(path)
+        jp = _compile_path(path)
         matches = jp.find(raw_json)
         if matches:
             for match in matches:
                 jsonpath_expr = Utils().get_path(match)
                 raw_json = Utils().update_json(raw_json, jsonpath_expr, value)
         else:
-            fields = []
-            Utils().recurse(jp, fields)
+            fields = _path_fields(path)
             temp_json = raw_json
             for idx, f in enumerate(fields):
                 if f in temp_json: